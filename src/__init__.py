@@ -1,7 +1 @@
-# customer_churn_prediction/requirements.txt
-pandas==2.2.2
-numpy==1.26.4
-scikit-learn==1.5.0
-matplotlib==3.9.0
-seaborn==0.13.2
-joblib==1.4.2
\ No newline at end of file
+# Makes 'src' a Python package, so its modules can be imported as 'src.<module>'.
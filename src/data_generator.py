@@ -1,155 +1,446 @@
 # --- Imports ---
-import pandas as pd # Import the pandas library, commonly aliased as 'pd'
 import numpy as np  # Import the numpy library, commonly aliased as 'np'
 import os           # Import the os module for interacting with the operating system (e.g., file paths)
 import logging      # Import the logging module for structured logging output
+import itertools    # Import itertools to list every combination of category labels
+from collections import deque                       # A queue used to keep track of chunks still being generated
+from concurrent.futures import ProcessPoolExecutor  # Runs chunk generation in several worker processes
 
-# Configure logging for this specific script.
-# This sets up how messages (INFO, WARNING, ERROR) will be displayed in the console.
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+# Logger for this module. How its messages are displayed is configured only when
+# the script is run directly (see the bottom of this file), so importing this
+# module doesn't change the logging setup of the program that imports it.
+logger = logging.getLogger(__name__)
 
-# --- Function Definition: generate_customer_churn_data ---
-def generate_customer_churn_data(num_samples: int = 1000, output_path: str = None):
+# --- Category Labels ---
+# Categorical columns are generated as small integer codes (int8) rather than strings.
+# Each code is an index into one of the label arrays below, so for example a
+# Contract code of 0 means 'Month-to-month' and a code of 2 means 'Two year'.
+GENDER_LABELS = np.array(['Male', 'Female'])
+YES_NO_LABELS = np.array(['No', 'Yes'])
+MULTIPLE_LINES_LABELS = np.array(['No', 'Yes', 'No phone service'])
+INTERNET_SERVICE_LABELS = np.array(['DSL', 'Fiber optic', 'No'])
+SERVICE_LABELS = np.array(['No', 'Yes', 'No internet service'])
+CONTRACT_LABELS = np.array(['Month-to-month', 'One year', 'Two year'])
+PAYMENT_METHOD_LABELS = np.array(['Electronic check', 'Mailed check', 'Bank transfer (automatic)', 'Credit card (automatic)'])
+
+# Codes that the generator compares against (positions in the label arrays above).
+NO_CODE = 0                # 'No' in YES_NO_LABELS and SERVICE_LABELS
+NO_PHONE_SERVICE_CODE = 2  # 'No phone service' in MULTIPLE_LINES_LABELS
+FIBER_OPTIC_CODE = 1       # 'Fiber optic' in INTERNET_SERVICE_LABELS
+NO_INTERNET_CODE = 2       # 'No' in INTERNET_SERVICE_LABELS
+MONTH_TO_MONTH_CODE = 0    # 'Month-to-month' in CONTRACT_LABELS
+TWO_YEAR_CODE = 2          # 'Two year' in CONTRACT_LABELS
+
+# Cumulative probabilities used to turn a uniform random number into a code for the
+# columns whose values are not equally likely. np.searchsorted returns the number of
+# thresholds below the random number, which is the code.
+SENIOR_CITIZEN_CDF = np.array([0.8])              # 80% 0, 20% 1
+INTERNET_SERVICE_CDF = np.array([0.4, 0.8])       # 40% DSL, 40% Fiber optic, 20% No
+CONTRACT_CDF = np.array([0.6, 0.8])               # 60% month-to-month, 20% one year, 20% two year
+
+# Text written to the CSV for the small integer columns, indexed by their value.
+SENIOR_CITIZEN_LABELS = np.array(['0', '1'])
+TENURE_LABELS = np.arange(72).astype(str)  # tenure is at most 71
+CHURN_LABELS = np.array(['0', '1'])
+
+# --- CSV Field Groups ---
+# Neighbouring categorical columns of the CSV are grouped, and the CSV text of every
+# possible combination of their labels is precomputed once. A whole group is then
+# written with a single lookup into that table (using a combined code, see
+# _combine_codes) instead of one string lookup and two joins per column.
+def _combine_labels(*label_arrays) -> np.ndarray:
     """
-    Generates a synthetic (fake) dataset for customer churn prediction.
-    This function creates realistic-looking data without using real customer information.
+    Builds the CSV text of every combination of labels, each followed by a comma.
 
     Args:
-        num_samples (int): The number of customer records (rows) to generate in the dataset.
-                           Default is 1000.
-        output_path (str): The full path where the generated CSV file should be saved.
-                           If None, it defaults to a path relative to the script.
+        *label_arrays (np.ndarray): The label array of each column in the group, in file order.
+
+    Returns:
+        np.ndarray: One string per combination, ordered like itertools.product
+                    (so the last column changes fastest).
     """
-    # Log an informational message indicating the start of data generation.
-    logging.info(f"Generating {num_samples} synthetic customer churn data samples...")
+    return np.array([','.join(combo) + ',' for combo in itertools.product(*label_arrays)])
+
+# gender, SeniorCitizen, Partner, Dependents, tenure (2 * 2 * 2 * 2 * 72 combinations).
+DEMOGRAPHICS_GROUP = (GENDER_LABELS, SENIOR_CITIZEN_LABELS, YES_NO_LABELS, YES_NO_LABELS, TENURE_LABELS)
+# PhoneService, MultipleLines, InternetService (2 * 3 * 3 combinations).
+PHONE_INTERNET_GROUP = (YES_NO_LABELS, MULTIPLE_LINES_LABELS, INTERNET_SERVICE_LABELS)
+# OnlineSecurity, OnlineBackup, DeviceProtection, TechSupport, StreamingTV, StreamingMovies (3 ** 6 combinations).
+SERVICES_GROUP = (SERVICE_LABELS,) * 6
+# Contract, PaperlessBilling, PaymentMethod (3 * 2 * 4 combinations).
+BILLING_GROUP = (CONTRACT_LABELS, YES_NO_LABELS, PAYMENT_METHOD_LABELS)
+
+DEMOGRAPHICS_TEXT = _combine_labels(*DEMOGRAPHICS_GROUP)
+PHONE_INTERNET_TEXT = _combine_labels(*PHONE_INTERNET_GROUP)
+SERVICES_TEXT = _combine_labels(*SERVICES_GROUP)
+BILLING_TEXT = _combine_labels(*BILLING_GROUP)
+
+# MonthlyCharges is written the same way. It always lies between 0.00 and 150.00
+# (base 20-120, fiber optic extra up to +30, no-internet discount up to -20), so it
+# has at most 15001 values in cents. The table holds the text of every amount,
+# followed by a comma, indexed by the amount in cents; looking it up gives the same
+# text as formatting with '%.2f,'.
+MAX_MONTHLY_CHARGES_CENTS = 15_000
+MONTHLY_CHARGES_TEXT = np.array([f'{cents // 100}.{cents % 100:02d},' for cents in range(MAX_MONTHLY_CHARGES_CENTS + 1)])
+
+# --- Output Layout ---
+# Rows are generated and written in chunks of this many customers, so memory use
+# stays roughly constant no matter how many samples are requested.
+CHUNK_SIZE = 32_768
+
+# Size of the output file's write buffer (1 MB). A large buffer means far fewer
+# write() system calls than Python's default of a few KB.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Column names of the generated CSV file, in file order.
+CSV_COLUMNS = [
+    'gender', 'SeniorCitizen', 'Partner', 'Dependents', 'tenure', 'PhoneService',
+    'MultipleLines', 'InternetService', 'OnlineSecurity', 'OnlineBackup',
+    'DeviceProtection', 'TechSupport', 'StreamingTV', 'StreamingMovies', 'Contract',
+    'PaperlessBilling', 'PaymentMethod', 'MonthlyCharges', 'TotalCharges', 'Churn',
+]
+
+# --- Helper Function: _total_charges ---
+def _total_charges(monthly_charges: np.ndarray, tenure: np.ndarray, noise: np.ndarray) -> np.ndarray:
+    """
+    Computes TotalCharges = max(0, MonthlyCharges * tenure + noise), rounded to 2 decimals.
+
+    Every step writes into the same output array (the 'out=' argument of the numpy
+    functions), so only one array is allocated instead of one per intermediate result.
+
+    Args:
+        monthly_charges (np.ndarray): Monthly bill of each customer.
+        tenure (np.ndarray): Months each customer has been with the company.
+        noise (np.ndarray): Random noise added to each customer's total.
+
+    Returns:
+        np.ndarray: The total charges of each customer.
+    """
+    total_charges = np.multiply(monthly_charges, tenure)
+    total_charges += noise
+    # Ensure no negative total charges (can happen with random noise).
+    np.maximum(total_charges, 0, out=total_charges)
+    # Round to 2 decimal places.
+    return np.round(total_charges, 2, out=total_charges)
+
+# --- Helper Function: _churn ---
+def _churn(contract_codes: np.ndarray, tenure: np.ndarray, monthly_charges: np.ndarray,
+           tech_support_codes: np.ndarray, rand: np.ndarray) -> np.ndarray:
+    """
+    Simulates the 'Churn' target (0 = No Churn, 1 = Churn) from a few customer features.
+
+    The churn probability is a weighted sum written as one vectorized expression:
+    each condition is a boolean array (True = 1, False = 0) multiplied by its weight.
+    The weights are whole percentages, so the sum is an int8 "churn score" (between
+    -30 and 85) instead of a float array, and each rule's boolean array is viewed as
+    int8 without a copy. NumPy still evaluates the expression one operation at a
+    time, so every mask, product and partial sum is its own temporary array and its
+    own pass over the data; keeping them int8 just makes those passes small.
+
+    Args:
+        contract_codes (np.ndarray): Contract codes (see CONTRACT_LABELS).
+        tenure (np.ndarray): Months each customer has been with the company.
+        monthly_charges (np.ndarray): Monthly bill of each customer.
+        tech_support_codes (np.ndarray): TechSupport codes (see SERVICE_LABELS).
+        rand (np.ndarray): Uniform random numbers in [0, 1), one per customer.
+
+    Returns:
+        np.ndarray: int8 array with 1 for customers who churn and 0 otherwise.
+    """
+    # Churn probability in percent.
+    churn_score = (
+        # Increase churn probability for certain conditions:
+        # Customers on month-to-month contracts are more likely to churn (+30%).
+        np.int8(30) * (contract_codes == MONTH_TO_MONTH_CODE).view(np.int8)
+        # Customers with low tenure (new customers) are sometimes more likely to churn (+20%).
+        + np.int8(20) * (tenure < 12).view(np.int8)
+        # Customers with very high monthly charges might be unhappy and churn (+15%).
+        + np.int8(15) * (monthly_charges > 80).view(np.int8)
+        # Customers without tech support are more likely to churn (+20%).
+        + np.int8(20) * (tech_support_codes == NO_CODE).view(np.int8)
+        # Decrease churn probability for certain conditions:
+        # Customers on 2-year contracts are less likely to churn (-30%).
+        - np.int8(30) * (contract_codes == TWO_YEAR_CODE).view(np.int8)
+    )
+
+    # Finally, assign churn (1) or no churn (0) based on the random draw against the
+    # calculated churn probability (the draw is scaled to percent to match the score).
+    # Viewing the boolean result as int8 avoids a copy.
+    return np.less(rand * 100, churn_score).view(np.int8)
+
+# --- Helper Function: _combine_codes ---
+def _combine_codes(label_arrays: tuple, codes: list) -> np.ndarray:
+    """
+    Combines the codes of a group of columns into one index into the group's text table.
+
+    This is the position of the combination in _combine_labels' output: the codes are
+    read as the digits of a mixed-radix number, with one digit per column.
+
+    Args:
+        label_arrays (tuple): The label array of each column in the group (e.g. DEMOGRAPHICS_GROUP).
+        codes (list): The code array of each column, in the same order.
+
+    Returns:
+        np.ndarray: The combined index of each row.
+    """
+    combined = np.zeros(len(codes[0]), dtype=np.intp)
+    for labels, column_codes in zip(label_arrays, codes):
+        combined *= len(labels)
+        combined += column_codes
+    return combined
+
+# --- Helper Function: _format_csv_rows ---
+def _format_csv_rows(fields: list) -> str:
+    """
+    Joins arrays of CSV text into CSV rows, one line per row.
+
+    The arrays are glued together with np.char.add, one whole array at a time, so
+    building the rows happens inside numpy instead of in a Python loop over cells.
+
+    Args:
+        fields (list): NumPy string arrays, in file order. All arrays must have the
+                       same length, and every array except the last must already
+                       end each value with a comma.
+
+    Returns:
+        str: The rows as CSV text (without a header), each ending with a newline.
+    """
+    rows = fields[0]
+    for field in fields[1:]:
+        rows = np.char.add(rows, field)
+    if len(rows) == 0:
+        return ''
+    return '\n'.join(rows.tolist()) + '\n'
+
+# --- Helper Function: _generate_chunk ---
+def _generate_chunk(rng: np.random.Generator, num_samples: int) -> str:
+    """
+    Generates one chunk of synthetic customer records.
+
+    Args:
+        rng (np.random.Generator): The random number generator to draw all values from.
+        num_samples (int): The number of customer records (rows) in this chunk.
 
+    Returns:
+        str: The chunk's rows as CSV text in CSV_COLUMNS order, ready to be
+             appended to the CSV file.
+    """
     # --- Define Features (Columns) and Generate Data for Each ---
-    # We use numpy's random functions to create diverse data.
+    # Every categorical column is kept as an array of int8 codes (see the label
+    # arrays at the top of this file). Codes take 1 byte per row instead of up to
+    # 100 bytes for a numpy string, and comparisons become cheap integer compares.
+    # Several columns share exactly the same set of possible values, so instead of
+    # drawing them one column at a time we draw all of them in a single call.
+
+    # Five plain 'No'/'Yes' columns: Partner, Dependents, PhoneService, PaperlessBilling
+    # and the MultipleLines candidate (used only when the customer has phone service).
+    yes_no_codes = rng.integers(0, 2, size=(5, num_samples), dtype=np.int8)
+    partner_codes, dependents_codes, phone_service_codes, paperless_billing_codes, multiple_lines_candidate = yes_no_codes
+
+    # Six service columns that can be 'No', 'Yes', or 'No internet service':
+    # OnlineSecurity, OnlineBackup, DeviceProtection, TechSupport, StreamingTV, StreamingMovies.
+    service_codes = rng.integers(0, 3, size=(6, num_samples), dtype=np.int8)
+    (online_security_codes, online_backup_codes, device_protection_codes,
+     tech_support_codes, streaming_tv_codes, streaming_movies_codes) = service_codes
+
+    # All the uniform random numbers needed below are drawn in one float32 block,
+    # one row per use, and rescaled or thresholded in place:
+    # row 0 -> SeniorCitizen, row 1 -> InternetService, row 2 -> Contract,
+    # row 3 -> base monthly charge, row 4 -> fiber optic extra,
+    # row 5 -> no-internet discount, row 6 -> churn draw.
+    uniforms = rng.random((7, num_samples), dtype=np.float32)
 
     # 'gender': Randomly choose 'Male' or 'Female' for each sample.
-    gender = np.random.choice(['Male', 'Female'], num_samples)
+    gender_codes = rng.integers(0, 2, num_samples, dtype=np.int8)
 
     # 'SeniorCitizen': Randomly choose 0 (No) or 1 (Yes).
-    # 'p=[0.8, 0.2]' means 80% will be 0, 20% will be 1.
-    senior_citizen = np.random.choice([0, 1], num_samples, p=[0.8, 0.2])
+    # 80% will be 0, 20% will be 1 (see SENIOR_CITIZEN_CDF).
+    # Stored as int8, since the values are only 0 or 1.
+    senior_citizen = np.searchsorted(SENIOR_CITIZEN_CDF, uniforms[0]).astype(np.int8)
 
-    # 'Partner': Whether the customer has a partner ('Yes' or 'No').
-    partner = np.random.choice(['Yes', 'No'], num_samples)
-
-    # 'Dependents': Whether the customer has dependents ('Yes' or 'No').
-    dependents = np.random.choice(['Yes', 'No'], num_samples)
+    # 'Partner' and 'Dependents': Whether the customer has a partner / dependents.
+    # Both come from the batched 'No'/'Yes' draw above.
 
     # 'tenure': How many months the customer has been with the company.
     # Random integer between 1 and 71 (inclusive of 1, exclusive of 72).
-    tenure = np.random.randint(1, 72, num_samples)
+    # int8 is enough for values up to 127.
+    tenure = rng.integers(1, 72, num_samples, dtype=np.int8)
 
     # 'PhoneService': Whether the customer has phone service ('Yes' or 'No').
-    phone_service = np.random.choice(['Yes', 'No'], num_samples)
+    # Also part of the batched 'No'/'Yes' draw above.
 
     # 'MultipleLines': Whether they have multiple phone lines.
     # 'No phone service' is an option if 'PhoneService' is 'No'.
-    multiple_lines = np.empty(num_samples, dtype='U16') # U16 for string length
-
-    for i in range(num_samples):
-        if phone_service[i] == 'No':
-            multiple_lines[i] = 'No phone service'
-        else:
-            # If they have phone service, then they can either have multiple lines or not
-            multiple_lines[i] = np.random.choice(['No', 'Yes'])
+    # Take the 'No'/'Yes' candidate drawn for every customer up front, then let np.where
+    # overwrite it with 'No phone service' wherever PhoneService is 'No'.
+    # This does the whole column in one vectorized step instead of a Python loop.
+    multiple_lines_codes = np.where(phone_service_codes == NO_CODE, np.int8(NO_PHONE_SERVICE_CODE), multiple_lines_candidate)
 
     # 'InternetService': Type of internet service.
-    # 'p=[0.4, 0.4, 0.2]' means 40% DSL, 40% Fiber optic, 20% No internet.
-    internet_service = np.random.choice(['DSL', 'Fiber optic', 'No'], num_samples, p=[0.4, 0.4, 0.2])
-
-    # Various service features: OnlineSecurity, OnlineBackup, DeviceProtection, TechSupport, StreamingTV, StreamingMovies.
-    # These can be 'No', 'Yes', or 'No internet service' (if InternetService is 'No').
-    online_security = np.random.choice(['No', 'Yes', 'No internet service'], num_samples)
-    online_backup = np.random.choice(['No', 'Yes', 'No internet service'], num_samples)
-    device_protection = np.random.choice(['No', 'Yes', 'No internet service'], num_samples)
-    tech_support = np.random.choice(['No', 'Yes', 'No internet service'], num_samples)
-    streaming_tv = np.random.choice(['No', 'Yes', 'No internet service'], num_samples)
-    streaming_movies = np.random.choice(['No', 'Yes', 'No internet service'], num_samples)
+    # 40% DSL, 40% Fiber optic, 20% No internet (see INTERNET_SERVICE_CDF).
+    internet_service_codes = np.searchsorted(INTERNET_SERVICE_CDF, uniforms[1]).astype(np.int8)
+    # The two InternetService conditions used further down are computed exactly once
+    # here, as int8 code comparisons, and reused by name.
+    is_fiber_optic = internet_service_codes == FIBER_OPTIC_CODE
+    is_no_internet = internet_service_codes == NO_INTERNET_CODE
 
     # 'Contract': Type of contract.
-    # 'p=[0.6, 0.2, 0.2]' means 60% month-to-month, 20% one year, 20% two year.
-    contract = np.random.choice(['Month-to-month', 'One year', 'Two year'], num_samples, p=[0.6, 0.2, 0.2])
-
-    # 'PaperlessBilling': Whether they receive paperless bills.
-    paperless_billing = np.random.choice(['Yes', 'No'], num_samples)
+    # 60% month-to-month, 20% one year, 20% two year (see CONTRACT_CDF).
+    contract_codes = np.searchsorted(CONTRACT_CDF, uniforms[2]).astype(np.int8)
 
     # 'PaymentMethod': How the customer pays.
-    payment_method = np.random.choice(['Electronic check', 'Mailed check', 'Bank transfer (automatic)', 'Credit card (automatic)'], num_samples)
+    payment_method_codes = rng.integers(0, 4, num_samples, dtype=np.int8)
 
     # 'MonthlyCharges': Simulated monthly bill.
-    # Start with a base uniform distribution.
-    monthly_charges = np.random.uniform(20, 120, num_samples)
-    # Add some correlation: Fiber optic internet usually means higher charges.
-    # We select only the samples where internet_service is 'Fiber optic' and add to their charges.
-    monthly_charges[internet_service == 'Fiber optic'] += np.random.uniform(10, 30, (internet_service == 'Fiber optic').sum())
-    # No internet service usually means lower charges.
-    monthly_charges[internet_service == 'No'] -= np.random.uniform(10, 20, (internet_service == 'No').sum())
-    # Round to 2 decimal places.
-    monthly_charges = np.round(monthly_charges, 2)
+    # Start with a base uniform distribution between 20 and 120.
+    monthly_charges = uniforms[3]
+    monthly_charges *= 100
+    monthly_charges += 20
+    # Add some correlation: Fiber optic internet usually means higher charges (+10 to 30),
+    # and no internet service usually means lower charges (-10 to 20).
+    # Noise is drawn for every customer and only applied (in place) where the
+    # precomputed InternetService mask is True.
+    fiber_optic_extra = uniforms[4]
+    fiber_optic_extra *= 20
+    fiber_optic_extra += 10
+    no_internet_discount = uniforms[5]
+    no_internet_discount *= 10
+    no_internet_discount += 10
+    np.add(monthly_charges, fiber_optic_extra, out=monthly_charges, where=is_fiber_optic)
+    np.subtract(monthly_charges, no_internet_discount, out=monthly_charges, where=is_no_internet)
+    # Round to 2 decimal places. Dollar amounts with 2 decimals fit comfortably in
+    # float32, which halves the memory traffic compared to float64.
+    np.round(monthly_charges, 2, out=monthly_charges)
 
     # 'TotalCharges': Simulated total charges over tenure.
-    # Base calculation: monthly_charges * tenure.
-    total_charges = monthly_charges * tenure
-    # Add some random noise to make it more realistic.
-    total_charges += np.random.normal(0, 50, num_samples)
-    # Ensure no negative total charges (can happen with random noise).
-    total_charges[total_charges < 0] = 0
-    # Round to 2 decimal places.
-    total_charges = np.round(total_charges, 2)
+    # Base calculation: monthly_charges * tenure, plus some random noise
+    # (normal, standard deviation 50) to make it more realistic, clamped at 0
+    # and rounded (see _total_charges).
+    noise = rng.standard_normal(num_samples, dtype=np.float32)
+    noise *= 50
+    total_charges = _total_charges(monthly_charges, tenure, noise)
 
     # --- Target Variable: 'Churn' (0 = No Churn, 1 = Churn) ---
-    # We'll simulate churn based on some common patterns observed in real data.
-    churn = np.zeros(num_samples, dtype=int) # Initialize all churn values to 0 (No Churn).
-    churn_prob = np.zeros(num_samples) # Initialize an array to store churn probabilities for each customer.
-
-    # Increase churn probability for certain conditions:
-    # Customers on month-to-month contracts are more likely to churn.
-    churn_prob[contract == 'Month-to-month'] += 0.3
-    # Customers with low tenure (new customers) are sometimes more likely to churn.
-    churn_prob[tenure < 12] += 0.2
-    # Customers with very high monthly charges might be unhappy and churn.
-    churn_prob[monthly_charges > 80] += 0.15
-    # Customers without tech support are more likely to churn.
-    churn_prob[tech_support == 'No'] += 0.2
-
-    # Decrease churn probability for certain conditions:
-    # Customers on 2-year contracts are less likely to churn.
-    churn_prob[contract == 'Two year'] -= 0.3
-
-    # Finally, assign churn (1) or no churn (0) based on a random draw
-    # against the calculated churn_prob.
-    churn = (np.random.rand(num_samples) < churn_prob).astype(int)
-
-    # --- Create Pandas DataFrame ---
-    # Combine all the generated arrays into a single Pandas DataFrame.
-    data = pd.DataFrame({
-        'gender': gender,
-        'SeniorCitizen': senior_citizen,
-        'Partner': partner,
-        'Dependents': dependents,
-        'tenure': tenure,
-        'PhoneService': phone_service,
-        'MultipleLines': multiple_lines,
-        'InternetService': internet_service,
-        'OnlineSecurity': online_security,
-        'OnlineBackup': online_backup,
-        'DeviceProtection': device_protection,
-        'TechSupport': tech_support,
-        'StreamingTV': streaming_tv,
-        'StreamingMovies': streaming_movies,
-        'Contract': contract,
-        'PaperlessBilling': paperless_billing,
-        'PaymentMethod': payment_method,
-        'MonthlyCharges': monthly_charges,
-        'TotalCharges': total_charges,
-        'Churn': churn # This is our target variable
-    })
-
-    # --- Save DataFrame to CSV ---
+    # We'll simulate churn based on some common patterns observed in real data
+    # (see _churn for the rules).
+    churn = _churn(contract_codes, tenure, monthly_charges, tech_support_codes, uniforms[6])
+
+    # --- Collect Output Columns ---
+    # Turn the generated arrays into CSV text, in the same order as CSV_COLUMNS.
+    # No Pandas DataFrame is built here: the CSV is written straight from these NumPy arrays.
+    # Each group of categorical columns becomes text with one lookup into its
+    # precomputed table (see CSV Field Groups at the top of this file). MonthlyCharges
+    # is also a table lookup, by its value in cents (see MONTHLY_CHARGES_TEXT);
+    # TotalCharges is formatted with 2 decimals by a single np.char.mod call.
+    # By construction MonthlyCharges lies in [0.00, 150.00] (20 - 20 >= 0 and
+    # 20 + 100 + 30 <= 150), so the cents always index into MONTHLY_CHARGES_TEXT.
+    # If the charge ranges above change, MAX_MONTHLY_CHARGES_CENTS must change too.
+    monthly_charges_cents = np.rint(monthly_charges * 100).astype(np.intp)
+    fields = [
+        DEMOGRAPHICS_TEXT[_combine_codes(DEMOGRAPHICS_GROUP, [
+            gender_codes, senior_citizen, partner_codes, dependents_codes, tenure])],
+        PHONE_INTERNET_TEXT[_combine_codes(PHONE_INTERNET_GROUP, [
+            phone_service_codes, multiple_lines_codes, internet_service_codes])],
+        SERVICES_TEXT[_combine_codes(SERVICES_GROUP, [
+            online_security_codes, online_backup_codes, device_protection_codes,
+            tech_support_codes, streaming_tv_codes, streaming_movies_codes])],
+        BILLING_TEXT[_combine_codes(BILLING_GROUP, [
+            contract_codes, paperless_billing_codes, payment_method_codes])],
+        MONTHLY_CHARGES_TEXT[monthly_charges_cents],  # 'MonthlyCharges'
+        np.char.mod('%.2f,', total_charges),          # 'TotalCharges'
+        CHURN_LABELS[churn],                          # 'Churn': this is our target variable
+    ]
+
+    return _format_csv_rows(fields)
+
+# --- Helper Function: _generate_chunks ---
+def _generate_chunks(chunk_rngs: list, chunk_sizes: list, n_jobs: int):
+    """
+    Generates all chunks of the dataset, yielding them one by one in file order.
+
+    Each chunk has its own independent random number generator, so the chunks can be
+    generated in any order (or at the same time) and still give the same dataset.
+
+    Args:
+        chunk_rngs (list): One np.random.Generator per chunk.
+        chunk_sizes (list): The number of rows in each chunk.
+        n_jobs (int): Number of worker processes. With 1, chunks are generated
+                      in the current process.
+
+    Yields:
+        str: The CSV text of each chunk, as returned by _generate_chunk.
+    """
+    if n_jobs == 1:
+        for chunk_rng, chunk_size in zip(chunk_rngs, chunk_sizes):
+            yield _generate_chunk(chunk_rng, chunk_size)
+        return
+
+    # Submit chunks to a pool of worker processes and hand back the results in order.
+    # At most 2 * n_jobs chunks are in flight at a time, so finished chunks don't pile
+    # up in memory while the main process is still writing earlier ones to disk.
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        pending = deque()
+        try:
+            for chunk_rng, chunk_size in zip(chunk_rngs, chunk_sizes):
+                pending.append(executor.submit(_generate_chunk, chunk_rng, chunk_size))
+                if len(pending) >= 2 * n_jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # If the caller stops early (e.g. a write failed), cancel the chunks that
+            # haven't started yet, so shutting down the pool only waits for running ones.
+            for future in pending:
+                future.cancel()
+
+# --- Function Definition: generate_customer_churn_data ---
+def generate_customer_churn_data(num_samples: int = 1000, output_path: str = None, seed: int = None,
+                                  chunk_size: int = CHUNK_SIZE, n_jobs: int = 1):
+    """
+    Generates a synthetic (fake) dataset for customer churn prediction.
+    This function creates realistic-looking data without using real customer information.
+
+    Args:
+        num_samples (int): The number of customer records (rows) to generate in the dataset.
+                           Default is 1000.
+        output_path (str): The full path where the generated CSV file should be saved.
+                           If None, it defaults to a path relative to the script.
+        seed (int): Seed for the random number generator. Passing the same seed
+                    produces exactly the same dataset. If None, a fresh random seed is used.
+        chunk_size (int): How many rows are generated and written at a time.
+                          Default is CHUNK_SIZE.
+        n_jobs (int): Number of worker processes used to generate chunks in parallel.
+                      Default is 1 (no extra processes). If None, all CPU cores are used.
+    """
+    # --- Check Arguments ---
+    # Invalid arguments are rejected before anything else happens, so the output
+    # file is never truncated (or left with only a header) by a call that can't succeed.
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(f"n_jobs must be at least 1 (or None to use all CPU cores), got {n_jobs}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+    # Log an informational message indicating the start of data generation.
+    # The isEnabledFor check skips building the message when INFO logs are turned off.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Generating {num_samples} synthetic customer churn data samples...")
+
+    # --- Set Up the Random Number Generator ---
+    # We use numpy's random functions to create diverse data.
+    # All draws come from numpy random Generators (PCG64) derived from 'seed',
+    # which are faster than the legacy global np.random state and make the
+    # generated dataset reproducible when a seed is given.
+    rng = np.random.default_rng(seed)
+
+    # Work out the size of every chunk, and give each chunk its own independent
+    # random stream with rng.spawn(). Because the streams belong to chunks (not to
+    # worker processes), the same seed gives the same data for any n_jobs.
+    chunk_sizes = [min(chunk_size, num_samples - start) for start in range(0, num_samples, chunk_size)]
+    chunk_rngs = rng.spawn(len(chunk_sizes))
+
+    # --- Prepare the Output File ---
     # Determine the output directory.
     # If output_path is not provided, construct a default path relative to the script's location.
     if output_path is None:
@@ -162,16 +453,34 @@ def generate_customer_churn_data(num_samples: int = 1000, output_path: str = Non
     output_dir = os.path.dirname(output_path)
     os.makedirs(output_dir, exist_ok=True) # exist_ok=True prevents error if dir already exists.
 
-    # Save the DataFrame to a CSV file.
-    # index=False prevents pandas from writing the DataFrame index as a column in the CSV.
-    data.to_csv(output_path, index=False)
-    logging.info(f"Synthetic data saved to '{output_path}'")
+    # --- Generate and Write the Data Chunk by Chunk ---
+    # The file is opened once and the header is written first. Then each chunk of
+    # rows is generated (see _generate_chunks) and appended straight to the file in
+    # order, so only a few chunks' worth of rows are ever held in memory.
+    # Each chunk arrives already formatted as CSV text, so writing it is one call.
+    # The file uses a WRITE_BUFFER_SIZE buffer and is never flushed explicitly;
+    # it is flushed once when the 'with' block closes it.
+    with open(output_path, 'w', buffering=WRITE_BUFFER_SIZE, newline='') as csv_file:
+        csv_file.write(','.join(CSV_COLUMNS) + '\n')
+        chunks = _generate_chunks(chunk_rngs, chunk_sizes, n_jobs)
+        try:
+            for chunk_text in chunks:
+                csv_file.write(chunk_text)
+        finally:
+            # If a write fails, closing the generator shuts down its worker processes (if any).
+            chunks.close()
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Synthetic data saved to '{output_path}'")
 
 # --- Conditional Execution Block ---
 # This block ensures that generate_customer_churn_data() is called only when
 # this script is executed directly (e.g., `python src/data_generator.py`),
 # not when it's imported as a module into another script.
 if __name__ == "__main__":
+    # Configure logging for this specific script.
+    # This sets up how messages (INFO, WARNING, ERROR) will be displayed in the console.
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+
     # Call the function to generate data.
     # We explicitly pass the output_path here to ensure it goes into the 'data' folder
     # relative to the project root, even if this script is run from 'src/'.
@@ -0,0 +1,89 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from src import data_generator
+
+
+def test_same_seed_gives_same_file_for_any_n_jobs(tmp_path):
+    serial_path = tmp_path / 'serial.csv'
+    parallel_path = tmp_path / 'parallel.csv'
+
+    # Small chunks so the data is split over several chunks (and worker processes).
+    data_generator.generate_customer_churn_data(5000, str(serial_path), seed=42, chunk_size=1000, n_jobs=1)
+    data_generator.generate_customer_churn_data(5000, str(parallel_path), seed=42, chunk_size=1000, n_jobs=2)
+
+    assert serial_path.read_bytes() == parallel_path.read_bytes()
+
+
+@pytest.mark.parametrize('arguments', [{'n_jobs': 0}, {'n_jobs': -1}, {'chunk_size': 0}])
+def test_invalid_arguments_raise_before_the_file_is_written(tmp_path, arguments):
+    output_path = tmp_path / 'data.csv'
+    output_path.write_text('existing data')
+
+    with pytest.raises(ValueError):
+        data_generator.generate_customer_churn_data(100, str(output_path), seed=0, **arguments)
+
+    assert output_path.read_text() == 'existing data'
+
+
+def test_generated_csv_reads_back_with_valid_values(tmp_path):
+    pd = pytest.importorskip('pandas')
+    output_path = tmp_path / 'data.csv'
+    data_generator.generate_customer_churn_data(5000, str(output_path), seed=7, chunk_size=1000)
+
+    lines = output_path.read_text().splitlines()
+    assert lines[0].split(',') == data_generator.CSV_COLUMNS
+    assert len(lines) == 5001
+    assert all(len(line.split(',')) == len(data_generator.CSV_COLUMNS) for line in lines[1:])
+
+    df = pd.read_csv(output_path)
+    assert list(df.columns) == data_generator.CSV_COLUMNS
+    categorical_labels = {
+        'gender': data_generator.GENDER_LABELS,
+        'Partner': data_generator.YES_NO_LABELS,
+        'Dependents': data_generator.YES_NO_LABELS,
+        'PhoneService': data_generator.YES_NO_LABELS,
+        'MultipleLines': data_generator.MULTIPLE_LINES_LABELS,
+        'InternetService': data_generator.INTERNET_SERVICE_LABELS,
+        'OnlineSecurity': data_generator.SERVICE_LABELS,
+        'OnlineBackup': data_generator.SERVICE_LABELS,
+        'DeviceProtection': data_generator.SERVICE_LABELS,
+        'TechSupport': data_generator.SERVICE_LABELS,
+        'StreamingTV': data_generator.SERVICE_LABELS,
+        'StreamingMovies': data_generator.SERVICE_LABELS,
+        'Contract': data_generator.CONTRACT_LABELS,
+        'PaperlessBilling': data_generator.YES_NO_LABELS,
+        'PaymentMethod': data_generator.PAYMENT_METHOD_LABELS,
+    }
+    for column, labels in categorical_labels.items():
+        assert set(df[column]) <= set(labels), column
+    assert set(df['SeniorCitizen']) <= {0, 1}
+    assert set(df['Churn']) <= {0, 1}
+    assert ((df['MultipleLines'] == 'No phone service') == (df['PhoneService'] == 'No')).all()
+    assert df['tenure'].between(1, 71).all()
+    assert df['MonthlyCharges'].between(0, 150).all()
+    assert (df['TotalCharges'] >= 0).all()
+
+
+@pytest.mark.parametrize('group, text', [
+    (data_generator.DEMOGRAPHICS_GROUP, data_generator.DEMOGRAPHICS_TEXT),
+    (data_generator.PHONE_INTERNET_GROUP, data_generator.PHONE_INTERNET_TEXT),
+    (data_generator.SERVICES_GROUP, data_generator.SERVICES_TEXT),
+    (data_generator.BILLING_GROUP, data_generator.BILLING_TEXT),
+])
+def test_group_text_matches_per_column_decode(group, text):
+    # Every combination of codes, one row per combination and one array per column.
+    combinations = list(itertools.product(*(range(len(labels)) for labels in group)))
+    codes = [np.array(column, dtype=np.int8) for column in zip(*combinations)]
+
+    looked_up = text[data_generator._combine_codes(group, codes)]
+    decoded = [','.join(labels[code] for labels, code in zip(group, row)) + ',' for row in combinations]
+    assert looked_up.tolist() == decoded
+
+
+def test_monthly_charges_text_matches_two_decimal_formatting():
+    cents = np.arange(data_generator.MAX_MONTHLY_CHARGES_CENTS + 1)
+    expected = [f'{amount:.2f},' for amount in cents / 100]
+    assert data_generator.MONTHLY_CHARGES_TEXT.tolist() == expected